@@ -3,6 +3,7 @@ import pandas as pd
 import pymysql
 import os
 from dotenv import load_dotenv
+import seismic_analytics as sa
 
 # --------------------------------------------------
 # 1. Streamlit config (MUST be first Streamlit call)
@@ -297,40 +298,69 @@ queries = {
         """     
     }
 }
+
 # --------------------------------------------------
-# 6. Sidebar Controls
+# 6. Python Analytics (run on the full catalog)
+# --------------------------------------------------
+CATALOG_SQL = """
+    SELECT id, time, latitude, longitude, mag, place, country
+    FROM earthquake
+    WHERE mag IS NOT NULL;
+"""
+
+analytics = {
+    "Aftershock Declustering (Gardner-Knopoff)": {
+        "Mainshocks vs Aftershocks": sa.mainshock_aftershock_counts,
+        "Top 10 Largest Aftershock Sequences": sa.largest_aftershock_sequences,
+        "Declustered Earthquakes per Year": sa.declustered_events_per_year
+    },
+
+    "Gutenberg-Richter & Completeness": {
+        "Catalog b-value & Magnitude of Completeness": sa.catalog_b_value,
+        "b-value by Country (>= 50 events above Mc)": sa.b_value_by_region,
+        "Magnitude of Completeness by Year": sa.completeness_by_year
+    }
+}
+topics = {**queries, **analytics}
+
+# --------------------------------------------------
+# 7. Sidebar Controls
 # --------------------------------------------------
 st.sidebar.header("🔍 Select Analysis")
 
 topic = st.sidebar.selectbox(
     "Topic",
-    list(queries.keys())
+    list(topics.keys())
 )
 
 question = st.sidebar.selectbox(
     "Query",
-    list(queries[topic].keys())
+    list(topics[topic].keys())
 )
 
 run = st.sidebar.button("▶ Run Query")
 
 # --------------------------------------------------
-# 7. Execute Query + Visualization
+# 8. Execute Query + Visualization
 # --------------------------------------------------
 if run:
-    sql = queries[topic][question]
-
     st.subheader(f"{topic} → {question}")
-    st.code(sql, language="sql")
 
-    df = run_query(sql)
+    if topic in analytics:
+        st.code(CATALOG_SQL, language="sql")
+        catalog = run_query(CATALOG_SQL)
+        df = analytics[topic][question](catalog) if not catalog.empty else catalog
+    else:
+        sql = queries[topic][question]
+        st.code(sql, language="sql")
+        df = run_query(sql)
 
     if not df.empty:
         st.success(f"✅ Rows returned: {len(df)}")
         st.dataframe(df, use_container_width=True)
 
         # --------------------------------------------------
-        # 8. Dynamic Visualization (Safe)
+        # 9. Dynamic Visualization (Safe)
         # --------------------------------------------------
         st.subheader("📊 Visualization")
 
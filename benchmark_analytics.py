@@ -0,0 +1,144 @@
+"""
+Benchmarks for seismic_analytics on synthetic catalogs.
+
+Usage:
+    python benchmark_analytics.py              # 1M events
+    python benchmark_analytics.py 2000000      # custom size
+    python benchmark_analytics.py --check      # compare decluster with brute force
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+import seismic_analytics as sa
+
+
+# --------------------------------------------------
+# 1. Synthetic catalog (Gutenberg-Richter mags + aftershock swarms)
+# --------------------------------------------------
+def synthetic_catalog(n_events, b_value=1.0, min_mag=2.5, seed=42):
+    rng = np.random.default_rng(seed)
+
+    # Background events on a handful of fault zones spread over 5 years
+    n_background = n_events // 2
+    zone_lat = rng.uniform(-60, 60, 200)
+    zone_lon = rng.uniform(-180, 180, 200)
+    zone = rng.integers(0, 200, n_background)
+    lat = zone_lat[zone] + rng.normal(0, 2.0, n_background)
+    lon = zone_lon[zone] + rng.normal(0, 2.0, n_background)
+    days = rng.uniform(0, 5 * 365, n_background)
+    mag = min_mag + rng.exponential(np.log10(np.e) / b_value, n_background)
+
+    # Aftershocks clustered around the largest background events (Omori-like decay)
+    n_after = n_events - n_background
+    parents = np.argsort(mag)[-max(n_after // 500, 1):]
+    parent = rng.choice(parents, n_after)
+    a_lat = lat[parent] + rng.normal(0, 0.2, n_after)
+    a_lon = lon[parent] + rng.normal(0, 0.2, n_after)
+    a_days = days[parent] + rng.pareto(1.1, n_after)
+    a_mag = np.minimum(
+        min_mag + rng.exponential(np.log10(np.e) / b_value, n_after),
+        mag[parent] - 0.1
+    )
+
+    return pd.DataFrame({
+        "id": np.arange(n_events),
+        "time": pd.Timestamp("2020-01-01") + pd.to_timedelta(np.concatenate((days, a_days)), unit="D"),
+        "latitude": np.clip(np.concatenate((lat, a_lat)), -90, 90),
+        "longitude": (np.concatenate((lon, a_lon)) + 180) % 360 - 180,
+        "mag": np.round(np.concatenate((mag, a_mag)), 1),
+        "country": np.char.add("zone_", np.concatenate((zone, zone[parent])).astype(str)),
+    })
+
+
+# --------------------------------------------------
+# 2. Brute-force reference (O(n^2), small catalogs only)
+# --------------------------------------------------
+def brute_force_decluster(time, latitude, longitude, mag, window="gardner_knopoff", foreshocks=True):
+    t = sa._to_days(time)
+    lat = np.radians(np.asarray(latitude, dtype=float))
+    lon = np.radians(np.asarray(longitude, dtype=float))
+    mag = np.asarray(mag, dtype=float)
+    dist_km, days = sa.WINDOWS[window](mag)
+    n = len(mag)
+    cluster = np.arange(n)
+
+    for i in np.lexsort((t, -mag)):
+        if cluster[i] != i:
+            continue
+        # Haversine distance from event i to every event
+        dist = 2 * sa.EARTH_RADIUS_KM * np.arcsin(np.sqrt(
+            np.sin((lat - lat[i]) / 2) ** 2
+            + np.cos(lat) * np.cos(lat[i]) * np.sin((lon - lon[i]) / 2) ** 2
+        ))
+        dt = t - t[i]
+        inside = (
+            (dist <= dist_km[i] * (1 + 1e-9))
+            & (dt <= days[i])
+            & (dt >= (-days[i] if foreshocks else 0))
+            & (mag <= mag[i])
+            & (cluster == np.arange(n))
+        )
+        inside[i] = False
+        cluster[inside] = i
+
+    return cluster
+
+
+def check(n_catalogs=30, n_events=3000):
+    print(f"--- Comparing decluster with brute force ({n_catalogs} catalogs) ---")
+    failures = 0
+    for seed in range(n_catalogs):
+        df = synthetic_catalog(n_events, seed=seed)
+        # Every other catalog uses coarse magnitudes to exercise same-magnitude ties
+        mag = df["mag"] if seed % 2 == 0 else np.round(df["mag"] * 2) / 2
+        for window in sa.WINDOWS:
+            for foreshocks in (True, False):
+                args = (df["time"], df["latitude"], df["longitude"], mag)
+                fast = sa.decluster(*args, window=window, foreshocks=foreshocks)
+                slow = brute_force_decluster(*args, window=window, foreshocks=foreshocks)
+                if not np.array_equal(fast, slow):
+                    failures += 1
+                    print(f"MISMATCH seed={seed} window={window} foreshocks={foreshocks}")
+
+    print("All catalogs match." if failures == 0 else f"{failures} mismatches.")
+    return failures == 0
+
+
+# --------------------------------------------------
+# 3. Timing helpers
+# --------------------------------------------------
+def timed(label, func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    print(f"{label:<40} {time.perf_counter() - start:8.2f} s")
+    return result
+
+
+def main(n_events):
+    print(f"--- Building synthetic catalog ({n_events:,} events) ---")
+    df = timed("synthetic_catalog", synthetic_catalog, n_events)
+
+    print("\n--- Declustering ---")
+    for window in sa.WINDOWS:
+        cluster = timed(
+            f"decluster ({window})", sa.decluster,
+            df["time"], df["latitude"], df["longitude"], df["mag"], window=window
+        )
+        mainshocks = int((cluster == np.arange(len(cluster))).sum())
+        print(f"{'':<40} mainshocks: {mainshocks:,}")
+
+    print("\n--- Gutenberg-Richter ---")
+    mc = timed("magnitude_of_completeness", sa.magnitude_of_completeness, df["mag"])
+    fit = timed("gutenberg_richter", sa.gutenberg_richter, df["mag"], mc)
+    print(f"{'':<40} Mc={fit.mc:.1f} b={fit.b_value:.3f} +/- {fit.b_error:.3f}")
+    timed("b_value_by_region", sa.b_value_by_region, df)
+    timed("completeness_by_year", sa.completeness_by_year, df)
+
+
+if __name__ == "__main__":
+    if "--check" in sys.argv:
+        sys.exit(0 if check() else 1)
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,352 @@
+"""
+Seismicity analytics for the earthquake catalog.
+
+- Mainshock / aftershock declustering with space-time windows
+  (Gardner-Knopoff, Gruenthal, Uhrhammer)
+- Magnitude of completeness (maximum curvature)
+- Gutenberg-Richter a/b-values (Aki-Utsu maximum likelihood)
+
+Pairwise comparisons are avoided: the catalog is sorted by time and cut
+into blocks, each with a KD-tree on unit-sphere coordinates, so an event
+only searches the space-time neighbourhood of its own window. Every step
+runs in O(n log n) instead of O(n^2).
+"""
+from collections import namedtuple
+from itertools import chain
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+EARTH_RADIUS_KM = 6371.0
+NS_PER_DAY = 86_400 * 10**9
+
+
+# --------------------------------------------------
+# 1. Declustering windows -> (distance km, time days)
+# --------------------------------------------------
+def gardner_knopoff_window(mag):
+    mag = np.asarray(mag, dtype=float)
+    dist_km = 10 ** (0.1238 * mag + 0.983)
+    days = np.where(
+        mag >= 6.5,
+        10 ** (0.032 * mag + 2.7389),
+        10 ** (0.5409 * mag - 0.547)
+    )
+    return dist_km, days
+
+
+def gruenthal_window(mag):
+    mag = np.asarray(mag, dtype=float)
+    dist_km = np.exp(1.77 + np.sqrt(0.037 + 1.02 * mag))
+    days = np.where(
+        mag >= 6.5,
+        10 ** (2.8 + 0.024 * mag),
+        np.exp(-3.95 + np.sqrt(np.clip(0.62 + 17.32 * mag, 0, None)))
+    )
+    return dist_km, days
+
+
+def uhrhammer_window(mag):
+    mag = np.asarray(mag, dtype=float)
+    dist_km = np.exp(-1.024 + 0.804 * mag)
+    days = np.exp(-2.87 + 1.235 * mag)
+    return dist_km, days
+
+
+WINDOWS = {
+    "gardner_knopoff": gardner_knopoff_window,
+    "gruenthal": gruenthal_window,
+    "uhrhammer": uhrhammer_window,
+}
+
+
+# --------------------------------------------------
+# 2. Index helpers
+# --------------------------------------------------
+def _to_days(time):
+    """Convert datetimes (or numbers already in days) to float days, NaT -> NaN."""
+    values = pd.Series(time)
+    if pd.api.types.is_numeric_dtype(values):
+        return values.to_numpy(dtype=float)
+    stamps = pd.to_datetime(values, utc=True).dt.tz_localize(None).astype("datetime64[ns]")
+    days = stamps.to_numpy().view("int64") / NS_PER_DAY
+    days[stamps.isna().to_numpy()] = np.nan
+    return days
+
+
+def _unit_vectors(latitude, longitude):
+    lat = np.radians(np.asarray(latitude, dtype=float))
+    lon = np.radians(np.asarray(longitude, dtype=float))
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
+
+
+def _chord(dist_km):
+    # Great-circle distance -> straight-line distance on the unit sphere
+    return 2 * np.sin(np.minimum(dist_km / EARTH_RADIUS_KM, np.pi) / 2)
+
+
+TimeIndex = namedtuple("TimeIndex", ["order", "bounds", "trees", "t0", "block_days"])
+
+
+def _time_index(t, xyz, block_days):
+    """Sort events by time, cut them into blocks and build one KD-tree per block."""
+    order = np.argsort(t, kind="stable")
+    t0 = t[order[0]]
+    block = ((t[order] - t0) // block_days).astype(np.int64)
+    bounds = np.searchsorted(block, np.arange(block[-1] + 2))
+    trees = [
+        cKDTree(xyz[order[lo:hi]]) if hi > lo else None
+        for lo, hi in zip(bounds[:-1], bounds[1:])
+    ]
+    return TimeIndex(order, bounds, trees, t0, block_days)
+
+
+def _window_edges(index, sources, t, xyz, mag, radius, days, foreshocks):
+    """
+    Return (src, dst) pairs where dst falls inside src's space-time window.
+
+    Each source only queries the time blocks its window overlaps instead of
+    every spatial neighbour in the whole catalog.
+    """
+    start = t[sources] - days[sources] if foreshocks else t[sources]
+    first = np.maximum((start - index.t0) // index.block_days, 0).astype(np.int64)
+    last = np.minimum(
+        (t[sources] + days[sources] - index.t0) // index.block_days, len(index.trees) - 1
+    ).astype(np.int64)
+
+    src_parts, dst_parts = [], []
+    for target in range(first.min(), last.max() + 1):
+        if index.trees[target] is None:
+            continue
+        src = sources[(first <= target) & (last >= target)]
+        if src.size == 0:
+            continue
+        neighbours = index.trees[target].query_ball_point(
+            xyz[src], radius[src], return_sorted=False
+        )
+        counts = np.fromiter(map(len, neighbours), dtype=np.intp, count=src.size)
+        local = np.fromiter(chain.from_iterable(neighbours), dtype=np.intp, count=counts.sum())
+        dst = index.order[index.bounds[target] + local]
+        src = np.repeat(src, counts)
+
+        dt = t[dst] - t[src]
+        keep = (dst != src) & (mag[dst] <= mag[src]) & (dt <= days[src])
+        keep &= (dt >= -days[src]) if foreshocks else (dt >= 0)
+
+        src_parts.append(src[keep])
+        dst_parts.append(dst[keep])
+
+    if not src_parts:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+    return np.concatenate(src_parts), np.concatenate(dst_parts)
+
+
+# --------------------------------------------------
+# 3. Declustering
+# --------------------------------------------------
+def decluster(time, latitude, longitude, mag, window="gardner_knopoff", foreshocks=True):
+    """
+    Window-based declustering.
+
+    Returns an integer array where each event holds the position of its
+    mainshock; mainshocks point to themselves (``cluster == arange(n)``).
+    Events are visited from the largest magnitude down (earliest first on
+    ties) and claim every unassigned smaller event inside their window.
+    With ``foreshocks=False`` only events after the mainshock are removed.
+    Events with a missing time, location or magnitude are their own cluster.
+
+    Each magnitude level is handled as one vectorized batch, so events that
+    were already claimed as aftershocks are never queried.
+    """
+    if window not in WINDOWS:
+        raise ValueError(f"Unknown window '{window}', choose from {list(WINDOWS)}")
+
+    t = _to_days(time)
+    latitude = np.asarray(latitude, dtype=float)
+    longitude = np.asarray(longitude, dtype=float)
+    mag = np.asarray(mag, dtype=float)
+    n = len(mag)
+    cluster = np.arange(n)
+    if n == 0:
+        return cluster
+
+    valid = np.isfinite(t) & np.isfinite(latitude) & np.isfinite(longitude) & np.isfinite(mag)
+    if not valid.all():
+        keep = np.flatnonzero(valid)
+        cluster[keep] = keep[decluster(
+            t[keep], latitude[keep], longitude[keep], mag[keep],
+            window=window, foreshocks=foreshocks
+        )]
+        return cluster
+
+    dist_km, days = WINDOWS[window](mag)
+    radius = _chord(dist_km)
+    xyz = _unit_vectors(latitude, longitude)
+    index = _time_index(t, xyz, max(float(np.median(days)), 1.0))
+
+    # Sorted (magnitude desc, time asc) index and each event's rank in it
+    order = np.lexsort((t, -mag))
+    rank = np.empty(n, dtype=np.intp)
+    rank[order] = np.arange(n)
+    levels = np.flatnonzero(np.diff(mag[order])) + 1
+
+    for level in np.split(order, levels):
+        sources = level[cluster[level] == level]
+        if sources.size == 0:
+            continue
+        src, dst = _window_edges(index, sources, t, xyz, mag, radius, days, foreshocks)
+        by_rank = np.argsort(rank[src], kind="stable")
+        src, dst = src[by_rank], dst[by_rank]
+
+        # Events of the same magnitude can claim each other: resolve in rank order
+        same = mag[dst] == mag[src]
+        if same.any():
+            same_src, same_dst = src[same], dst[same]
+            heads = np.flatnonzero(np.r_[True, same_src[1:] != same_src[:-1]])
+            for lo, hi in zip(heads, np.r_[heads[1:], same_src.size]):
+                i = same_src[lo]
+                if cluster[i] != i:
+                    continue
+                members = same_dst[lo:hi]
+                members = members[cluster[members] == members]
+                cluster[members] = i
+
+        # Smaller events go to the highest-ranked surviving mainshock
+        keep = ~same & (cluster[src] == src) & (cluster[dst] == dst)
+        dst, first = np.unique(dst[keep], return_index=True)
+        cluster[dst] = src[keep][first]
+
+    return cluster
+
+
+def decluster_catalog(df, window="gardner_knopoff", foreshocks=True):
+    """Add ``cluster_id`` (id of the mainshock row) and ``is_mainshock`` columns."""
+    df = df.dropna(subset=["time", "latitude", "longitude", "mag"]).reset_index(drop=True)
+    cluster = decluster(
+        df["time"], df["latitude"], df["longitude"], df["mag"],
+        window=window, foreshocks=foreshocks
+    )
+    df["cluster_id"] = df["id"].to_numpy()[cluster] if "id" in df else cluster
+    df["is_mainshock"] = cluster == np.arange(len(df))
+    return df
+
+
+# --------------------------------------------------
+# 4. Magnitude of completeness & Gutenberg-Richter
+# --------------------------------------------------
+GRFit = namedtuple("GRFit", ["mc", "a_value", "b_value", "b_error", "n_events"])
+
+
+def magnitude_of_completeness(mag, bin_width=0.1, correction=0.2):
+    """Maximum curvature Mc: mode of the binned magnitudes plus a correction."""
+    mag = np.asarray(mag, dtype=float)
+    mag = mag[np.isfinite(mag)]
+    if mag.size == 0:
+        return np.nan
+
+    bins = np.round(mag / bin_width).astype(np.int64)
+    lowest = bins.min()
+    mode = np.argmax(np.bincount(bins - lowest)) + lowest
+    return round(mode * bin_width + correction, 6)
+
+
+def gutenberg_richter(mag, mc=None, bin_width=0.1):
+    """Aki-Utsu b-value with Shi & Bolt uncertainty for events at or above Mc."""
+    mag = np.asarray(mag, dtype=float)
+    mag = mag[np.isfinite(mag)]
+    if mc is None:
+        mc = magnitude_of_completeness(mag, bin_width)
+
+    complete = mag[mag >= mc - bin_width / 2]
+    n = complete.size
+    if n < 2:
+        return GRFit(mc, np.nan, np.nan, np.nan, n)
+
+    mean = complete.mean()
+    b = np.log10(np.e) / (mean - (mc - bin_width / 2))
+    b_error = 2.3 * b**2 * np.sqrt(((complete - mean) ** 2).sum() / (n * (n - 1)))
+    a = np.log10(n) + b * mc
+    return GRFit(mc, a, b, b_error, n)
+
+
+# --------------------------------------------------
+# 5. Dashboard topics (catalog DataFrame -> result DataFrame)
+# --------------------------------------------------
+def mainshock_aftershock_counts(df):
+    df = decluster_catalog(df)
+    return (
+        df["is_mainshock"]
+        .map({True: "Mainshock", False: "Aftershock / Foreshock"})
+        .value_counts()
+        .rename_axis("event_class")
+        .reset_index(name="total_events")
+    )
+
+
+def largest_aftershock_sequences(df, limit=10):
+    df = decluster_catalog(df)
+    sizes = (
+        df.loc[~df["is_mainshock"]]
+        .groupby("cluster_id")
+        .size()
+        .rename("aftershocks")
+    )
+    mainshocks = df.loc[df["is_mainshock"]].set_index("cluster_id")
+    columns = [c for c in ["place", "mag", "country"] if c in mainshocks]
+    return (
+        mainshocks[columns]
+        .join(sizes, how="inner")
+        .sort_values("aftershocks", ascending=False)
+        .head(limit)
+        .rename_axis("id")
+        .reset_index()
+    )
+
+
+def declustered_events_per_year(df):
+    df = decluster_catalog(df)
+    year = pd.to_datetime(df["time"]).dt.year.rename("year")
+    return (
+        df.groupby(year)
+        .agg(total_events=("is_mainshock", "size"), mainshocks=("is_mainshock", "sum"))
+        .reset_index()
+    )
+
+
+def catalog_b_value(df):
+    # b_value first: the dashboard shows the first numeric column of a single row
+    fit = gutenberg_richter(df["mag"])
+    columns = ["b_value", "b_error", "mc", "a_value", "n_events"]
+    return pd.DataFrame([fit._asdict()])[columns].round(3)
+
+
+def b_value_by_region(df, region="country", min_events=50):
+    """b-value per region, keeping regions with ``min_events`` at or above their Mc."""
+    fits = []
+    for name, group in df.groupby(region):
+        fit = gutenberg_richter(group["mag"])
+        if fit.n_events >= min_events:
+            fits.append({region: name, **fit._asdict()})
+    if not fits:
+        return pd.DataFrame()
+
+    # b_value last: the dashboard charts the last numeric column
+    columns = [region, "n_events", "mc", "a_value", "b_error", "b_value"]
+    return (
+        pd.DataFrame(fits)[columns]
+        .sort_values("b_value", ascending=False)
+        .round(3)
+    )
+
+
+def completeness_by_year(df):
+    df = df.dropna(subset=["time", "mag"])
+    year = pd.to_datetime(df["time"]).dt.year.rename("year")
+    return (
+        df.groupby(year)["mag"]
+        .agg(magnitude_of_completeness)
+        .rename("mc")
+        .reset_index()
+    )